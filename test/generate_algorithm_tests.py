@@ -1,7 +1,65 @@
 #!/usr/bin/env python3
 
 import os
-from typing import List, Tuple
+
+from generator_utils import dump, make_dirs
+
+# Expected output marking that player 1 (chasing) must win
+VERIFY_CHASING_WINS = b"VERIFY_CHASING_WINS\n"
+
+# Algorithm comparison test cases: (name, map content, expected winner)
+_ALG_TESTS = (
+    # Test 1: Simple direct path
+    (
+        "direct_path",
+        b"Direct Path Test\nMaxSteps = 1000\nNumShells = 10\nRows = 5\nCols = 10\n"
+        b"##########\n"
+        b"#1      2#\n"
+        b"#        #\n"
+        b"#        #\n"
+        b"##########\n",
+        1  # Player 1 (chasing) should win
+    ),
+
+    # Test 2: Maze with multiple paths
+    (
+        "maze_paths",
+        b"Maze Test\nMaxSteps = 2000\nNumShells = 15\nRows = 7\nCols = 15\n"
+        b"###############\n"
+        b"#1  #   #    #\n"
+        b"# # # # # ## #\n"
+        b"#   #   #    #\n"
+        b"### ### #### #\n"
+        b"#          2 #\n"
+        b"###############\n",
+        1
+    ),
+
+    # Test 3: Open battlefield with mines
+    (
+        "mine_field",
+        b"Mine Field Test\nMaxSteps = 1500\nNumShells = 20\nRows = 6\nCols = 12\n"
+        b"############\n"
+        b"#1   @    #\n"
+        b"#  @   @  #\n"
+        b"#   @ @   #\n"
+        b"#  @   2  #\n"
+        b"############\n",
+        1
+    ),
+
+    # Test 4: Limited shells test
+    (
+        "limited_shells",
+        b"Limited Shells Test\nMaxSteps = 2000\nNumShells = 3\nRows = 5\nCols = 10\n"
+        b"##########\n"
+        b"#1      #\n"
+        b"#   @   #\n"
+        b"#      2#\n"
+        b"##########\n",
+        1
+    ),
+)
 
 class AlgorithmTestGenerator:
     """Generates test cases for comparing algorithms."""
@@ -9,86 +67,50 @@ class AlgorithmTestGenerator:
     def __init__(self, base_dir: str = "."):
         """Initialize the test generator."""
         self.base_dir = base_dir
-        self.maps_dir = os.path.join(base_dir, "maps", "algorithm_comparison")
-        self.expected_dir = os.path.join(base_dir, "expected_outputs")
+        self.maps_dir = os.sep.join((base_dir, "maps", "algorithm_comparison"))
+        self.expected_dir = os.sep.join((base_dir, "expected_outputs"))
         
         # Create directories if they don't exist
-        os.makedirs(self.maps_dir, exist_ok=True)
-        os.makedirs(self.expected_dir, exist_ok=True)
+        make_dirs((base_dir, os.sep.join((base_dir, "maps")), self.maps_dir,
+                   self.expected_dir, os.sep.join((base_dir, "..", "build"))))
         
         # Set algorithm configuration
         self.write_algorithm_config()
     
     def write_algorithm_config(self):
         """Write the algorithm configuration file."""
-        config_path = os.path.join(self.base_dir, "..", "build", "algorithm_types.txt")
-        with open(config_path, 'w') as f:
-            f.write("chasing\nrotating")
-    
-    def write_test_case(self, name: str, map_content: str, expected_winner: int):
-        """Write a test case and its expected output."""
-        # Write map file
-        map_path = os.path.join(self.maps_dir, f"{name}.txt")
-        with open(map_path, 'w') as f:
-            f.write(map_content)
-        
-        # Write expected output - we only care that player 1 (chasing) wins
-        output_path = os.path.join(self.expected_dir, f"{name}_expected.txt")
-        with open(output_path, 'w') as f:
-            f.write("VERIFY_CHASING_WINS\n")
+        config_path = os.sep.join((self.base_dir, "..", "build", "algorithm_types.txt"))
+        dump(config_path, b"chasing\nrotating")
     
     def generate_all_tests(self):
         """Generate all algorithm comparison test cases."""
-        # Test 1: Simple direct path
-        self.write_test_case(
-            "direct_path",
-            "Direct Path Test\nMaxSteps = 1000\nNumShells = 10\nRows = 5\nCols = 10\n"
-            "##########\n"
-            "#1      2#\n"
-            "#        #\n"
-            "#        #\n"
-            "##########\n",
-            1  # Player 1 (chasing) should win
-        )
-        
-        # Test 2: Maze with multiple paths
-        self.write_test_case(
-            "maze_paths",
-            "Maze Test\nMaxSteps = 2000\nNumShells = 15\nRows = 7\nCols = 15\n"
-            "###############\n"
-            "#1  #   #    #\n"
-            "# # # # # ## #\n"
-            "#   #   #    #\n"
-            "### ### #### #\n"
-            "#          2 #\n"
-            "###############\n",
-            1
-        )
-        
-        # Test 3: Open battlefield with mines
-        self.write_test_case(
-            "mine_field",
-            "Mine Field Test\nMaxSteps = 1500\nNumShells = 20\nRows = 6\nCols = 12\n"
-            "############\n"
-            "#1   @    #\n"
-            "#  @   @  #\n"
-            "#   @ @   #\n"
-            "#  @   2  #\n"
-            "############\n",
-            1
-        )
-        
-        # Test 4: Limited shells test
-        self.write_test_case(
-            "limited_shells",
-            "Limited Shells Test\nMaxSteps = 2000\nNumShells = 3\nRows = 5\nCols = 10\n"
-            "##########\n"
-            "#1      #\n"
-            "#   @   #\n"
-            "#      2#\n"
-            "##########\n",
-            1
-        )
+        # Directories already exist, so the compiled writer only has to write
+        exec(build_generator(self.maps_dir, self.expected_dir),
+             {"dump": dump, "VERIFY_CHASING_WINS": VERIFY_CHASING_WINS})
+
+# Compiled writers from build_generator, keyed by target directories
+_generated = {}
+
+def build_generator(maps_dir: str, expected_dir: str):
+    """Compile a flat script writing every algorithm test case.
+
+    Paths and map contents from _ALG_TESTS are inlined as literals around
+    calls to dump, so running the code object issues the writes with no
+    per-test method or path overhead.
+    """
+    code = _generated.get((maps_dir, expected_dir))
+    if code is None:
+        lines = ["def _run():"]
+        for name, map_content, _ in _ALG_TESTS:
+            map_path = f"{maps_dir}{os.sep}{name}.txt"
+            output_path = f"{expected_dir}{os.sep}{name}_expected.txt"
+            lines.append(f"    dump({map_path!r}, {map_content!r})")
+            # We only care that player 1 (chasing) wins
+            lines.append(f"    dump({output_path!r}, VERIFY_CHASING_WINS)")
+        lines.append("_run()")
+        code = compile("\n".join(lines) + "\n", "<gen>", "exec")
+        _generated[(maps_dir, expected_dir)] = code
+    return code
 
 def main():
     generator = AlgorithmTestGenerator()
@@ -1,114 +1,200 @@
 #!/usr/bin/env python3
 
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+from generator_utils import dump, make_dirs
+
+# Expected outputs shared between test cases
+ERR_EMPTY_MAP = b"Error parsing input file: Empty map file\n"
+ERR_INVALID_PARAM = b"Error parsing input file: Invalid parameter format: \n"
+ERR_INVALID_MAXSTEPS = b"Error parsing input file: Invalid value in parameter: MaxSteps = abc\n"
+P1_WIN_2 = b"Player 1 won with 2 tanks still alive\n"
+P1_WIN_1 = b"Player 1 won with 1 tanks still alive\n"
+TIE_ZERO = b"Tie, both players have zero tanks\n"
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+
+CATEGORIES = ('file_system', 'header_errors', 'dimension_mismatches',
+              'content_edge_cases', 'game_logic')
+
+# Every directory the generator writes into
+_ALL_DIRS = ({f"{BASE}{os.sep}maps{os.sep}{c}" for c in CATEGORIES}
+             | {f"{BASE}{os.sep}maps", f"{BASE}{os.sep}expected_outputs",
+                f"{BASE}{os.sep}..{os.sep}build"})
+
 class TestCaseGenerator:
     def __init__(self):
-        self.base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.base_dir = BASE
+        self.maps_root = os.sep.join((self.base_dir, 'maps'))
+        self.out_root = os.sep.join((self.base_dir, 'expected_outputs'))
+        self.manifest_path = os.sep.join((self.base_dir, '.test_manifest.json'))
+
+        # [content hash, size, mtime_ns] of each file as verified by the previous run
+        try:
+            with open(self.manifest_path) as f:
+                self.manifest: Dict[str, list] = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.manifest = {}
+
+        # Create every target directory once, before any test case is written
+        make_dirs(_ALL_DIRS)
+
+    def write_if_changed(self, path: str, data: bytes):
+        """Write data to path unless the file already holds exactly that content."""
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+        known = self.manifest.get(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+
+        # A missing file or a size mismatch settles it without reading anything
+        if st is None or st.st_size != len(data):
+            st = None
+        elif known != [digest, st.st_size, st.st_mtime_ns]:
+            # The file changed since it was last verified, so check its content
+            with open(path, 'rb') as f:
+                if f.read() != data:
+                    st = None
+        if st is None:
+            dump(path, data)
+            st = os.stat(path)
+
+        # Record the verified on-disk state, not just the intended content
+        self.manifest[path] = [digest, st.st_size, st.st_mtime_ns]
+
+    def save_manifest(self):
+        """Atomically replace the manifest with the file states of this run."""
+        tmp_path = f"{self.manifest_path}.tmp"
+        dump(tmp_path, json.dumps(self.manifest, indent=1, sort_keys=True).encode('ascii'))
+        os.replace(tmp_path, self.manifest_path)
         
     def generate_all_test_cases(self):
         """Generate all test cases for each category."""
-        self.generate_file_system_tests()
-        self.generate_header_error_tests()
-        self.generate_dimension_mismatch_tests()
-        self.generate_content_edge_case_tests()
+        tests = (self.generate_file_system_tests()
+                 + self.generate_header_error_tests()
+                 + self.generate_dimension_mismatch_tests()
+                 + self.generate_content_edge_case_tests())
+
+        # Directories exist already and each test case writes to its own paths,
+        # so the writes can overlap
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda test: self.write_test_case(*test), tests))
+
         self.generate_game_logic_tests()
+        self.save_manifest()
         
-    def write_test_case(self, category: str, filename: str, content: str, expected_output: str):
+    def write_test_case(self, category: str, stem: str, content: bytes, expected_output: bytes):
         """Write a test case and its expected output."""
         # Create test map
-        map_path = os.path.join(self.base_dir, 'maps', category, filename)
-        with open(map_path, 'w') as f:
-            f.write(content)
+        map_path = f"{self.maps_root}{os.sep}{category}{os.sep}{stem}.txt"
+        self.write_if_changed(map_path, content)
             
         # Create expected output
-        output_path = os.path.join(self.base_dir, 'expected_outputs', 
-                                 f"{os.path.splitext(filename)[0]}_expected.txt")
-        with open(output_path, 'w') as f:
-            f.write(expected_output)
+        output_path = f"{self.out_root}{os.sep}{stem}_expected.txt"
+        self.write_if_changed(output_path, expected_output)
             
     def generate_file_system_tests(self):
         """Generate file system related test cases."""
+        tests = []
+
         # Empty file test
-        self.write_test_case(
+        tests.append((
             'file_system',
-            'empty_map.txt',
-            '',
-            'Error parsing input file: Empty map file\n'
-        )
+            'empty_map',
+            b'',
+            ERR_EMPTY_MAP
+        ))
         
         # Binary file test will be created by the test runner
         
         # CRLF line endings test
-        self.write_test_case(
+        tests.append((
             'file_system',
-            'crlf_map.txt',
-            'Test Map\r\nMaxSteps = 100\r\nNumShells = 5\r\nRows = 3\r\nCols = 3\r\n\r\n1 1\r\n   \r\n2 2\r\n',
-            'Player 1 won with 2 tanks still alive\n'
-        )
-        
+            'crlf_map',
+            b'Test Map\r\nMaxSteps = 100\r\nNumShells = 5\r\nRows = 3\r\nCols = 3\r\n\r\n1 1\r\n   \r\n2 2\r\n',
+            P1_WIN_2
+        ))
+
+        return tests
+
     def generate_header_error_tests(self):
         """Generate header error test cases."""
+        tests = []
+
         # Missing MaxSteps
-        self.write_test_case(
+        tests.append((
             'header_errors',
-            'missing_maxsteps.txt',
-            'Test Map\nNumShells = 5\nRows = 3\nCols = 3\n\n1 1\n   \n2 2\n',
-            'Error parsing input file: Invalid parameter format: \n'
-        )
+            'missing_maxsteps',
+            b'Test Map\nNumShells = 5\nRows = 3\nCols = 3\n\n1 1\n   \n2 2\n',
+            ERR_INVALID_PARAM
+        ))
         
         # Missing NumShells
-        self.write_test_case(
+        tests.append((
             'header_errors',
-            'missing_numshells.txt',
-            'Test Map\nMaxSteps = 100\nRows = 3\nCols = 3\n\n1 1\n   \n2 2\n',
-            'Error parsing input file: Invalid parameter format: \n'
-        )
+            'missing_numshells',
+            b'Test Map\nMaxSteps = 100\nRows = 3\nCols = 3\n\n1 1\n   \n2 2\n',
+            ERR_INVALID_PARAM
+        ))
         
         # Invalid values
-        self.write_test_case(
+        tests.append((
             'header_errors',
-            'invalid_values.txt',
-            'Test Map\nMaxSteps = abc\nNumShells = 5\nRows = -1\nCols = 3.14\n\n1 1\n   \n2 2\n',
-            'Error parsing input file: Invalid value in parameter: MaxSteps = abc\n'
-        )
-        
+            'invalid_values',
+            b'Test Map\nMaxSteps = abc\nNumShells = 5\nRows = -1\nCols = 3.14\n\n1 1\n   \n2 2\n',
+            ERR_INVALID_MAXSTEPS
+        ))
+
+        return tests
+
     def generate_dimension_mismatch_tests(self):
         """Generate dimension mismatch test cases."""
+        tests = []
+
         # Fewer rows than specified
-        self.write_test_case(
+        tests.append((
             'dimension_mismatches',
-            'fewer_rows.txt',
-            'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 5\nCols = 3\n\n1 1\n   \n',
-            'Player 1 won with 2 tanks still alive\n'
-        )
+            'fewer_rows',
+            b'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 5\nCols = 3\n\n1 1\n   \n',
+            P1_WIN_2
+        ))
         
         # More rows than specified
-        self.write_test_case(
+        tests.append((
             'dimension_mismatches',
-            'more_rows.txt',
-            'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 2\nCols = 3\n\n1 1\n   \n2 2\nExtra\nExtra\n',
-            'Player 1 won with 2 tanks still alive\n'
-        )
-        
+            'more_rows',
+            b'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 2\nCols = 3\n\n1 1\n   \n2 2\nExtra\nExtra\n',
+            P1_WIN_2
+        ))
+
+        return tests
+
     def generate_content_edge_case_tests(self):
         """Generate content edge case test cases."""
+        tests = []
+
         # No tanks
-        self.write_test_case(
+        tests.append((
             'content_edge_cases',
-            'no_tanks.txt',
-            'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 3\nCols = 3\n\n   \n   \n   \n',
-            'Tie, both players have zero tanks\n'
-        )
+            'no_tanks',
+            b'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 3\nCols = 3\n\n   \n   \n   \n',
+            TIE_ZERO
+        ))
         
         # Only Player 1 tank
-        self.write_test_case(
+        tests.append((
             'content_edge_cases',
-            'only_player1.txt',
-            'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 3\nCols = 3\n\n1  \n   \n   \n',
-            'Player 1 won with 1 tanks still alive\n'
-        )
+            'only_player1',
+            b'Test Map\nMaxSteps = 100\nNumShells = 5\nRows = 3\nCols = 3\n\n1  \n   \n   \n',
+            P1_WIN_1
+        ))
+
+        return tests
         
     def generate_game_logic_tests(self):
         """Generate game logic test cases."""
@@ -118,21 +204,18 @@ class TestCaseGenerator:
     def generate_shell_exhaustion_test(self):
         """Generate shell exhaustion test case with custom verification logic."""
         # Set up algorithm configuration for this test
-        config_path = os.path.join(self.base_dir, '..', 'build', 'algorithm_types.txt')
-        with open(config_path, 'w') as f:
-            f.write("chasing\nchasing\n")
+        config_path = os.sep.join((self.base_dir, '..', 'build', 'algorithm_types.txt'))
+        dump(config_path, b"chasing\nchasing\n")
         
         # Create test map
-        map_path = os.path.join(self.base_dir, 'maps', 'game_logic', 'shell_exhaustion.txt')
-        with open(map_path, 'w') as f:
-            f.write('Test Map\nMaxSteps = 100\nNumShells = 1\nRows = 5\nCols = 5\n\n1   2\n     \n     \n     \n     \n')
+        map_path = f"{self.maps_root}{os.sep}game_logic{os.sep}shell_exhaustion.txt"
+        dump(map_path, b'Test Map\nMaxSteps = 100\nNumShells = 1\nRows = 5\nCols = 5\n\n1   2\n     \n     \n     \n     \n')
         
         # Create a special verification file that indicates this needs custom verification
-        output_path = os.path.join(self.base_dir, 'expected_outputs', 'shell_exhaustion_expected.txt')
-        with open(output_path, 'w') as f:
-            # First line must contain "Shoot" somewhere
-            # Last line must be exactly this after 40 steps of no shells
-            f.write('VERIFY_SHELL_EXHAUSTION\n')
+        output_path = f"{self.out_root}{os.sep}shell_exhaustion_expected.txt"
+        # First line must contain "Shoot" somewhere
+        # Last line must be exactly this after 40 steps of no shells
+        dump(output_path, b'VERIFY_SHELL_EXHAUSTION\n')
 
 def main():
     generator = TestCaseGenerator()
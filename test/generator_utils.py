@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+import os
+from typing import Iterable
+
+# Directories already created or found by this process
+_created = set()
+
+def dump(path: str, data: bytes):
+    """Write data to path through a single unbuffered file descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked, so keep going until all is written
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def make_dirs(paths: Iterable[str]):
+    """Create the given directories in one sorted pass.
+
+    Sorting puts each parent before its children, so listed parents are
+    created first with a single mkdir each. A parent that was not listed
+    is created on demand. Directories already handled by this process are
+    skipped.
+    """
+    for path in sorted(paths):
+        if path in _created:
+            continue
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
+        _created.add(path)
@@ -56,23 +56,9 @@ run_test() {
     read -r first_line < "$expected_output"
     
     case "$first_line" in
-        "VERIFY_SHELL_EXHAUSTION")
-            # Use Python to verify shell exhaustion
-            if python3 - <<EOF
-import sys
-sys.path.append("${TEST_DIR}")
-from verify_output import OutputVerifier
-verifier = OutputVerifier()
-with open("${actual_output}", 'r') as f:
-    actual = f.read()
-if verifier.verify_shell_exhaustion(actual):
-    sys.exit(0)
-else:
-    print("Verification errors:", file=sys.stderr)
-    for error in verifier.get_errors():
-        print(f"  {error}", file=sys.stderr)
-    sys.exit(1)
-EOF
+        "VERIFY_SHELL_EXHAUSTION"|"VERIFY_CHASING_WINS")
+            # Use Python to verify the rule named on the first line
+            if python3 "${TEST_DIR}/verify_output.py" "${actual_output}" "$expected_output"
             then
                 echo -e "${GREEN}✓ Test passed: $test_name${NC}"
                 ((PASSED_TESTS++))
@@ -83,40 +69,13 @@ EOF
                 cat "${actual_output}"
                 echo
                 echo -e "${BLUE}EXPECTED OUTPUT:${NC}"
-                echo "1. Must contain 'Shoot' action"
-                echo "2. Must end with 'Tie, both players have zero shells for 40 steps'"
-            fi
-            ;;
-            
-        "VERIFY_CHASING_WINS")
-            # Use Python to verify chasing algorithm wins
-            if python3 - <<EOF
-import sys
-sys.path.append("${TEST_DIR}")
-from verify_output import OutputVerifier
-verifier = OutputVerifier()
-with open("${actual_output}", 'r') as f:
-    actual = f.read()
-if verifier.verify_chasing_wins(actual):
-    sys.exit(0)
-else:
-    print("Verification errors:", file=sys.stderr)
-    for error in verifier.get_errors():
-        print(f"  {error}", file=sys.stderr)
-    sys.exit(1)
-EOF
-            then
-                echo -e "${GREEN}✓ Test passed: $test_name${NC}"
-                ((PASSED_TESTS++))
-            else
-                echo -e "${RED}✗ Test failed: $test_name${NC}"
-                echo -e "${PINK}Test failed! Here are the differences:${NC}"
-                echo -e "${BLUE}ACTUAL OUTPUT (your program's output):${NC}"
-                cat "${actual_output}"
-                echo
-                echo -e "${BLUE}EXPECTED OUTPUT:${NC}"
-                echo "1. Must contain 'Shoot' action (tanks must engage in combat)"
-                echo "2. Must end with 'Player 1 won with X tanks still alive'"
+                if [ "$first_line" = "VERIFY_SHELL_EXHAUSTION" ]; then
+                    echo "1. Must contain 'Shoot' action"
+                    echo "2. Must end with 'Tie, both players have zero shells for 40 steps'"
+                else
+                    echo "1. Must contain 'Shoot' action (tanks must engage in combat)"
+                    echo "2. Must end with 'Player 1 won with X tanks still alive'"
+                fi
             fi
             ;;
             
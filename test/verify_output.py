@@ -1,87 +1,125 @@
 #!/usr/bin/env python3
 
 import sys
-import re
-from typing import List, Tuple, Dict
+from collections import namedtuple
+from functools import partial
+from typing import List
+
+_SHOOT = b"Shoot"
+_TIE = b"Tie, both players have zero shells for 40 steps"
+_P1WIN = b"Player 1 won with"
+
+_Parsed = namedtuple('_Parsed', 'has_shoot last_line')
+
+def _parse_text(actual_output: bytes) -> _Parsed:
+    """Split game output into whether any but the last line shot, and the last line."""
+    text = actual_output.strip()
+    nl = text.rfind(b'\n')
+    return _Parsed(nl > 0 and text.find(_SHOOT, 0, nl) >= 0, text[nl + 1:])
 
 class OutputVerifier:
     """Verifies test output based on custom rules."""
     
     def __init__(self):
         self.errors = []
+        # Parsed outputs keyed by id(); each entry keeps its output alive so the id stays unique
+        self._cache = {}
     
-    def verify_shell_exhaustion(self, actual_output: str) -> bool:
+    def _parse(self, actual_output: bytes) -> _Parsed:
+        """Parse an output once per verifier, however many predicates check it."""
+        entry = self._cache.get(id(actual_output))
+        if entry is None:
+            entry = (actual_output, _parse_text(actual_output))
+            self._cache[id(actual_output)] = entry
+        return entry[1]
+    
+    def verify_shell_exhaustion(self, actual_output: bytes) -> bool:
         """Verify shell exhaustion test case.
         
         Requirements:
         1. Must contain "Shoot" in the output (tanks must shoot)
         2. Must end with "Tie, both players have zero shells for 40 steps"
         """
-        lines = actual_output.strip().split('\n')
-        
-        # Check if any line contains "Shoot"
-        found_shoot = False
-        for line in lines[:-1]:  # Check all but last line
-            if "Shoot" in line:
-                found_shoot = True
-                break
+        # Check if any line but the last contains "Shoot"
+        found_shoot, last_line = self._parse(actual_output)
         
         # Check if last line is the expected tie message
-        last_line = lines[-1] if lines else ""
-        correct_ending = last_line == "Tie, both players have zero shells for 40 steps"
+        correct_ending = last_line == _TIE
         
         if not found_shoot:
             self.errors.append("No 'Shoot' action found in output")
         if not correct_ending:
-            self.errors.append(f"Expected last line to be 'Tie, both players have zero shells for 40 steps', but got: {last_line}")
+            self.errors.append(f"Expected last line to be 'Tie, both players have zero shells for 40 steps', but got: {last_line.decode(errors='replace')}")
         
         return found_shoot and correct_ending
     
-    def verify_chasing_wins(self, actual_output: str) -> bool:
+    def verify_chasing_wins(self, actual_output: bytes) -> bool:
         """Verify that the chasing algorithm (player 1) wins.
         
         Requirements:
         1. The game must end with player 1 winning
         2. At least one tank must have shot (to ensure it's not just movement)
         """
-        lines = actual_output.strip().split('\n')
-        if not lines:
+        found_shoot, last_line = self._parse(actual_output)
+        if not last_line:
             self.errors.append("Empty output")
             return False
             
-        # Check if any tank shot
-        found_shoot = False
-        for line in lines[:-1]:  # Check all but last line
-            if "Shoot" in line:
-                found_shoot = True
-                break
-                
+        # Check if any tank shot (all but the last line)
         if not found_shoot:
             self.errors.append("No 'Shoot' action found in output - tanks must engage in combat")
             return False
             
         # Check if player 1 won
-        last_line = lines[-1]
-        if not last_line.startswith("Player 1 won with"):
-            self.errors.append(f"Expected player 1 (chasing) to win, but got: {last_line}")
+        if not last_line.startswith(_P1WIN):
+            self.errors.append(f"Expected player 1 (chasing) to win, but got: {last_line.decode(errors='replace')}")
             return False
             
         return True
     
+    def verify_exact(self, actual_output: bytes, expected_output: bytes) -> bool:
+        """Verify that the output matches the expected output byte for byte."""
+        if actual_output != expected_output:
+            self.errors.append("Output differs from the expected output")
+            return False
+        return True
+    
     def get_errors(self) -> List[str]:
         """Get list of verification errors."""
         return self.errors
 
 def main():
     if len(sys.argv) != 3:
-        print("Usage: verify_output.py <actual_output> <expected_output>")
+        print("Usage: verify_output.py <actual_output_file|-> <expected_output_file>")
         sys.exit(1)
         
+    # Read the game log as raw bytes from the given file, or stdin for "-"
+    try:
+        if sys.argv[1] == "-":
+            actual_output = sys.stdin.buffer.read()
+        else:
+            with open(sys.argv[1], 'rb') as f:
+                actual_output = f.read()
+        with open(sys.argv[2], 'rb') as f:
+            expected_output = f.read()
+    except OSError as e:
+        print(f"Error: cannot read {e.filename or '<stdin>'}: {e.strerror}", file=sys.stderr)
+        sys.exit(1)
+    
+    # The first line of the expected output selects the verification rule;
+    # any other expected output must match exactly
     verifier = OutputVerifier()
-    if not verifier.verify_shell_exhaustion(sys.argv[1]):
-        print("Verification failed!")
+    rule = expected_output.partition(b'\n')[0].strip()
+    if rule == b"VERIFY_CHASING_WINS":
+        verify = verifier.verify_chasing_wins
+    elif rule == b"VERIFY_SHELL_EXHAUSTION":
+        verify = verifier.verify_shell_exhaustion
+    else:
+        verify = partial(verifier.verify_exact, expected_output=expected_output)
+    if not verify(actual_output):
+        print("Verification failed!", file=sys.stderr)
         for error in verifier.get_errors():
-            print(f"Error: {error}")
+            print(f"Error: {error}", file=sys.stderr)
         sys.exit(1)
     else:
         print("Verification passed!")